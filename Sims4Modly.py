@@ -5,22 +5,25 @@
 # Stdlib
 import os
 import re
-import io
 import csv
 import json
 import time
 import shutil
-import struct
+import sys
 import zipfile
 import threading
 import datetime
+import functools
+from collections import Counter, deque
 
 # GUI
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 
 # Dataclasses
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Mapping
 
 # -------------------------
 # App constants (safe to tweak)
@@ -31,7 +34,8 @@ APP_VERSION: str = "1.1.0"
 
 # Paths (change if you want a different settings/log location)
 CONFIG_PATH: str = os.path.join(os.path.expanduser("~"), ".sims4_modsorter_settings.json")
-LOG_NAME: str    = ".sims4_modsorter_moves.json"  # move/undo history written in Mods
+LOG_NAME: str    = ".sims4_modsorter_moves.jsonl"  # move/undo history written in Mods (one batch per line)
+LEGACY_LOG_NAME: str = ".sims4_modsorter_moves.json"  # JSON-list log used before the JSONL format; still honoured by Undo
 
 # Detection pipeline order shown in Settings
 # You can reorder at runtime; this is just the default.
@@ -64,7 +68,7 @@ FOLDER_PRESETS = {
 # should keep selected text readable (white or very dark).
 # -------------------------
 
-THEMES: dict[str, dict[str, str]] = {
+THEMES: Mapping[str, Mapping[str, str]] = MappingProxyType({
     "Dark Mode":        {"bg": "#111316", "fg": "#E6E6E6", "alt": "#161A1E", "accent": "#4C8BF5", "sel": "#2A2F3A"},
     "Slightly Dark":    {"bg": "#14161a", "fg": "#EAEAEA", "alt": "#1b1e24", "accent": "#6AA2FF", "sel": "#2f3642"},
     "Light Mode":       {"bg": "#FAFAFA", "fg": "#1f2328", "alt": "#FFFFFF", "accent": "#316DCA", "sel": "#E8F0FE"},
@@ -75,7 +79,7 @@ THEMES: dict[str, dict[str, str]] = {
     "Melon":            {"bg": "#D9EF62", "fg": "#1F2328", "alt": "#A3CF5A", "accent": "#FF4044", "sel": "#FF7176"},
     "King":             {"bg": "#0B132B", "fg": "#E6EDF3", "alt": "#101B33", "accent": "#F2C94C", "sel": "#1B2A4A"},
     "Jester":           {"bg": "#0F0A14", "fg": "#EDECF5", "alt": "#161021", "accent": "#FF4D6D", "sel": "#26152F"},
-}
+})
 
 # =========================
 # Section 2 — Columns → Classification
@@ -83,7 +87,7 @@ THEMES: dict[str, dict[str, str]] = {
 
 # ---- Tree columns (UI depends on these exact ids/order)
 COLUMNS = ("inc", "rel", "name", "ext", "type", "size", "target", "notes", "conf")
-HEADERS = {
+HEADERS: Mapping[str, str] = MappingProxyType({
     "inc": "✓",
     "rel": "Folder",
     "name": "File",
@@ -93,10 +97,12 @@ HEADERS = {
     "target": "Target Folder",
     "notes": "Notes",
     "conf": "Conf",
-}
+})
+# Wide columns grown by the resize pass: (column, base width, share of spare width)
+_RESIZE_SHARES = (("name", 360, 0.55), ("notes", 360, 0.45))
 
 # ---- Category order controls sort grouping in the UI
-CATEGORY_ORDER = [
+CATEGORY_ORDER: tuple[str, ...] = (
     "Script Mod",
     "Gameplay Mods",
     "Gameplay Tuning",
@@ -112,10 +118,13 @@ CATEGORY_ORDER = [
     "Archive",
     "Other",
     "Unknown",
-]
+)
+
+# Sort-key lookup for CATEGORY_ORDER (O(1) instead of list.index per item)
+CATEGORY_RANK: Mapping[str, int] = MappingProxyType({c: i for i, c in enumerate(CATEGORY_ORDER)})
 
 # ---- Default target folders for each category (you can rename the values)
-DEFAULT_FOLDER_MAP: dict[str, str] = {
+DEFAULT_FOLDER_MAP: Mapping[str, str] = MappingProxyType({
     "Script Mod": "Script Mods",
     "Gameplay Mods": "Gameplay Mods",
     "Gameplay Tuning": "Gameplay Tuning",
@@ -131,10 +140,10 @@ DEFAULT_FOLDER_MAP: dict[str, str] = {
     "Archive": "Archives",
     "Other": "Other",
     "Unknown": "Unsorted",
-}
+})
 
 # ---- A row in the planning table
-@dataclass
+@dataclass(slots=True)
 class FileItem:
     path: str
     name: str
@@ -146,6 +155,11 @@ class FileItem:
     notes: str
     include: bool
     target_folder: str
+    # Folder column text, derived once from relpath (which never changes)
+    rel_dir: str = field(default="", init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.rel_dir = os.path.dirname(self.relpath) or "."
 
 # ---- General helpers
 
@@ -167,6 +181,14 @@ def human_mb(size_bytes: int) -> float:
     """Convert bytes to MB with 2 decimals."""
     return round(size_bytes / (1024 * 1024), 2)
 
+def _split_name_ext(name: str) -> tuple[str, str]:
+    """os.path.splitext for a bare filename (no folder part), without the
+    separator/altsep scanning. Leading dots never start an extension."""
+    i = name.rfind(".")
+    if i <= 0 or (name[0] == "." and not name[:i].strip(".")):
+        return name, ""
+    return name[:i], name[i:]
+
 # Smarter prettifier: keeps extension, inserts spaces in Camel/PascalCase,
 # splits letters↔digits, and normalises separators.
 _CAMEL_SPLIT_RE = re.compile(
@@ -178,23 +200,28 @@ _CAMEL_SPLIT_RE = re.compile(
     """, re.X
 )
 
+_WS_RE = re.compile(r"\s+")
+_SEP_TO_SPACE = str.maketrans("_-.", "   ")
+
 def _humanize_stem(stem: str) -> str:
-    # Normalise common separators first
-    s = stem.replace("_", " ").replace("-", " ").replace(".", " ")
+    # Normalise common separators first (single pass)
+    s = stem.translate(_SEP_TO_SPACE)
     # Insert spaces at camel/digit boundaries
     s = _CAMEL_SPLIT_RE.sub(" ", s)
     # Collapse repeats
-    s = re.sub(r"\s+", " ", s).strip()
+    s = _WS_RE.sub(" ", s).strip()
     return s
 
 def prettify_for_ui(name: str) -> str:
     """Human-friendly filename for display: 'WerewolfCondomWrapper.package'
     → 'Werewolf Condom Wrapper.package'. Does not rename on disk."""
-    base, ext = os.path.splitext(name)
+    base, ext = _split_name_ext(name)
     return f"{_humanize_stem(base)}{ext}"
 
+@functools.lru_cache(maxsize=256)
 def route_slot_for_category(cat: str) -> str:
-    """Route any detected category label into one of the six top-level slots."""
+    """Route any detected category label into one of the six top-level slots.
+    Labels come from a small set, so results are cached (one dict probe per file)."""
     c = (cat or "").lower()
 
     # Highest priority
@@ -246,7 +273,7 @@ def detect_real_ext(name: str) -> tuple[str, bool]:
     base = low
     if disabled:
         base = low[: -len(".off")] if low.endswith(".off") else low[: -len(".disabled")]
-    ext = os.path.splitext(base)[1]
+    ext = _split_name_ext(base)[1]
     return (ext if ext else ""), disabled
 
 # One variable: sorted list of (keyword, category) tuples.
@@ -257,7 +284,8 @@ def detect_real_ext(name: str) -> tuple[str, bool]:
 
 # Single variable: ALL keywords (original + extras), normalised to lowercase, sorted by (keyword, category).
 # Categories are grouped with comments only for readability — the value is ONE list literal passed to sorted().
-_KEYWORDS = sorted([
+# Frozen below into _KEYWORDS, a de-duplicated tuple of interned (keyword, category) pairs.
+_KEYWORDS_RAW = sorted([
     # --- Script / Frameworks / Core ---
     ("ui cheats","script mod"),("uicheats","script mod"),("ui-cheats","script mod"),("cheats","script mod"),("cheat","script mod"),
     ("cmd","script mod"),("mccc","script mod"),("mc cmd center","script mod"),("mc command","script mod"),("mc command center","script mod"),
@@ -392,9 +420,12 @@ _KEYWORDS = sorted([
     ("wickedwhims animation","adult animation"),("ww animations","adult animation"),("ww anarcis","adult animation"),("anarcis","adult animation"),
     ("condom wrapper", "Adult CAS"), ("condomwrapper", "Adult CAS"), ("condom", "Adult BuildBuy"), ("condoms", "Adult BuildBuy"),
 ], key=lambda kv: (kv[0], kv[1]))
+_KEYWORDS: tuple[tuple[str, str], ...] = tuple(dict.fromkeys(
+    (sys.intern(k.lower().strip()), sys.intern(v)) for k, v in _KEYWORDS_RAW
+))
 
 # --- Canonical category mapping (keywords may use synonyms/sub-cats)
-_CANON = {
+_CANON: Mapping[str, str] = MappingProxyType({
     # Adult
     "adult gameplay": "Adult - Gameplay",
     "adult animation": "Adult - Gameplay",   # funnel animations to gameplay bucket
@@ -413,14 +444,57 @@ _CANON = {
     "cas eyes": "CAS Accessories",
     "cas tattoos": "CAS Accessories",
     "cas skin": "CAS Accessories",
-}
+})
 
 # Prefer longer phrases first: "phone ui" beats "phone"
-_KW = sorted(((k.lower().strip(), v) for (k, v) in _KEYWORDS), key=lambda kv: (-len(kv[0]), kv[0]))
+_KW = tuple(sorted(_KEYWORDS, key=lambda kv: (-len(kv[0]), kv[0])))
 
 def _canon(cat: str) -> str:
     return _CANON.get(cat, cat)
 
+def _build_keyword_automaton(keys: list[str]) -> tuple[list[dict[str, int]], list[int]]:
+    """
+    Aho–Corasick automaton over keys, compiled to a DFA (delta, best).
+    delta[state][ch] is the next state (missing → 0, the root); best[state]
+    is the lowest key index ending at that state, len(keys) if none.
+    """
+    no_hit = len(keys)
+    delta: list[dict[str, int]] = [{}]
+    best: list[int] = [no_hit]
+    for i, kw in enumerate(keys):
+        if not kw:
+            continue
+        s = 0
+        for ch in kw:
+            nxt = delta[s].get(ch)
+            if nxt is None:
+                nxt = len(delta)
+                delta[s][ch] = nxt
+                delta.append({}); best.append(no_hit)
+            s = nxt
+        best[s] = min(best[s], i)
+
+    # Breadth-first so every fail state is complete before its dependants;
+    # folding its moves in means matching never has to walk fail links.
+    fail = [0] * len(delta)
+    queue = deque(delta[0].values())
+    while queue:
+        s = queue.popleft()
+        trie_edges = list(delta[s].items())
+        if s:
+            for ch, t in delta[fail[s]].items():
+                delta[s].setdefault(ch, t)
+        for ch, nxt in trie_edges:
+            queue.append(nxt)
+            fail[nxt] = delta[fail[s]].get(ch, 0) if s else 0
+            best[nxt] = min(best[nxt], best[fail[nxt]])
+    return delta, best
+
+# One pass over the name finds the best-ranked _KW hit (same winner as
+# testing each keyword in _KW order, without ~400 substring scans per file).
+_KW_NO_HIT = len(_KW)
+_KW_DELTA, _KW_BEST = _build_keyword_automaton([kw for kw, _ in _KW])
+
 # --- DBPF resource type → category hints (little-endian type IDs)
 # These are safe heuristics; we don't fully parse DBPF (fast).
 _RESOURCE_TYPE_HINTS = {
@@ -436,34 +510,45 @@ _RESOURCE_TYPE_HINTS = {
     0xA0F3F4D4: ("Animation",      "DBPF: CLIP"),   # animation clip
 }
 
+# Preference order when several type IDs are present
+_RESOURCE_TYPE_PRIORITY = (
+    0x034AEECB, 0x319E4F1D, 0x0333406C, 0xEBCF4E9B, 0xA0F3F4D4,
+    0x015A1849, 0x3453CF95, 0x00B2D882, 0x220557DA,
+)
+
 # Precompute the byte sequences we want to find (little-endian)
 _RESOURCE_TYPE_BYTES = {t: t.to_bytes(4, "little") for t in _RESOURCE_TYPE_HINTS.keys()}
 
-def _scan_for_types_dbpf(path: str, head_bytes: int = 256 * 1024, tail_bytes: int = 128 * 1024) -> set[int]:
+def _scan_for_types_dbpf(path: str, head_bytes: int = 256 * 1024, tail_bytes: int = 128 * 1024) -> frozenset[int]:
     """
     Fast string-scan for known DBPF type IDs in the head and tail of a file.
     We avoid full DBPF parsing for speed and robustness.
-    Returns a set of int type IDs we detected.
+    Returns the int type IDs we detected (empty if not a DBPF file).
+    Cached per (path, mtime, size), so rescans skip unchanged packages.
+    Read errors are not cached: the next scan of that file tries again.
     """
-    hits: set[int] = set()
     try:
-        size = os.path.getsize(path)
-        with open(path, "rb") as f:
-            # Read head
-            chunk = f.read(min(head_bytes, size))
-            for tid, sig in _RESOURCE_TYPE_BYTES.items():
-                if sig in chunk:
-                    hits.add(tid)
-            # Read tail
-            if size > tail_bytes:
-                f.seek(max(0, size - tail_bytes))
-                chunk = f.read(tail_bytes)
-                for tid, sig in _RESOURCE_TYPE_BYTES.items():
-                    if sig in chunk:
-                        hits.add(tid)
-    except Exception:
-        pass
-    return hits
+        st = os.stat(path)
+        return _scan_for_types_dbpf_cached(path, st.st_mtime_ns, st.st_size, head_bytes, tail_bytes)
+    except OSError:
+        return frozenset()
+
+@functools.lru_cache(maxsize=65536)
+def _scan_for_types_dbpf_cached(path: str, _mtime_ns: int, size: int,
+                                head_bytes: int, tail_bytes: int) -> frozenset[int]:
+    # Unbuffered: two large reads, so a BufferedReader would only add a copy
+    with open(path, "rb", buffering=0) as f:
+        # Read head (also carries the DBPF magic)
+        head = f.read(min(head_bytes, size))
+        if head[:4] != b"DBPF":
+            return frozenset()
+        # Read tail only when the head didn't already cover the whole file
+        tail = b""
+        if size > head_bytes:
+            f.seek(size - tail_bytes)
+            tail = f.read(tail_bytes)
+    return frozenset(tid for tid, sig in _RESOURCE_TYPE_BYTES.items()
+                     if sig in head or sig in tail)
 
 # Folder-name hints: if the file already lives under a meaningful folder,
 # gently raise confidence toward the matching category.
@@ -519,6 +604,7 @@ def _boost_from_parent_dirs(relpath: str, cur: tuple[str, float, str]) -> tuple[
         notes = (notes + f"; parent hint: {hint}").strip("; ")
     return (cat, conf, notes)
 
+@functools.lru_cache(maxsize=65536)
 def guess_type_for_name(name: str, ext: str) -> tuple[str, float, str]:
     """
     Tuple-aware keyword detector:
@@ -532,10 +618,16 @@ def guess_type_for_name(name: str, ext: str) -> tuple[str, float, str]:
     if ext in (".zip", ".rar", ".7z"):
         return ("Archive", 0.7, "archive")
 
-    for kw, cat in _KW:
-        if kw and kw in n:
-            cat = _canon(cat)
-            return (cat, 0.70, f"Keyword: {kw}")
+    delta, best = _KW_DELTA, _KW_BEST
+    s = 0
+    hit = _KW_NO_HIT
+    for ch in n:
+        s = delta[s].get(ch, 0)
+        if best[s] < hit:
+            hit = best[s]
+    if hit < _KW_NO_HIT:
+        kw, cat = _KW[hit]
+        return (_canon(cat), 0.70, f"Keyword: {kw}")
 
     if ext == ".package":
         return ("Unknown", 0.40, "Package with no keyword match")
@@ -554,12 +646,6 @@ def guess_type_binary(path: str, current: tuple[str, float, str]) -> tuple[str,
     cat, conf, notes = current
     if not path.lower().endswith(".package"):
         return current
-    try:
-        with open(path, "rb") as f:
-            if f.read(4) != b"DBPF":
-                return current
-    except Exception:
-        return current
 
     hits = _scan_for_types_dbpf(path)
     if not hits:
@@ -568,12 +654,7 @@ def guess_type_binary(path: str, current: tuple[str, float, str]) -> tuple[str,
     # Prioritise the strongest semantic hits
     best_cat = None
     best_note = None
-    # preference order
-    order = [
-        0x034AEECB, 0x319E4F1D, 0x0333406C, 0xEBCF4E9B, 0xA0F3F4D4,
-        0x015A1849, 0x3453CF95, 0x00B2D882, 0x220557DA,
-    ]
-    for tid in order:
+    for tid in _RESOURCE_TYPE_PRIORITY:
         if tid in hits:
             best_cat, best_note = _RESOURCE_TYPE_HINTS[tid]
             break
@@ -602,6 +683,7 @@ def classify_file(path: str, name: str, ext: str,
     - enable_binary: skip 'binary' stage if False
     """
     cur: tuple[str, float, str] = ("Unknown", 0.0, "")
+    name_res: tuple[str, float, str] | None = None  # "name" and "ext" share one result
     order = order or DEFAULT_DETECTOR_ORDER
     for step in order:
         if step == "binary" and not enable_binary:
@@ -609,7 +691,12 @@ def classify_file(path: str, name: str, ext: str,
         fn = _DETECTOR_FUNCS.get(step)
         if not fn:
             continue
-        res = fn(path, name, ext, cur)
+        if step in ("name", "ext"):
+            if name_res is None:
+                name_res = fn(path, name, ext, cur)
+            res = name_res
+        else:
+            res = fn(path, name, ext, cur)
         if not (isinstance(res, tuple) and len(res) == 3):
             continue
         cat, conf, note = res
@@ -655,9 +742,8 @@ def _parse_date_from_name(name: str) -> float | None:
     return None
 
 def _date_from_zip(path: str) -> float | None:
+    # ZipFile rejects non-zips itself (BadZipFile), so no is_zipfile pre-open
     try:
-        if not zipfile.is_zipfile(path):
-            return None
         latest = None
         with zipfile.ZipFile(path, "r") as z:
             for zi in z.infolist():
@@ -708,6 +794,30 @@ def plan_collisions(collisions: list[tuple[str, str, str]]) -> list[dict]:
     return plan
 
 # ---- Scanner
+def _iter_files(root: str, recurse: bool = True):
+    """
+    Yield an os.DirEntry for every file under root, in os.walk order
+    (a folder's files before its subfolders; symlinked dirs not followed).
+    Entries cache their stat, so no separate getsize call is needed.
+    """
+    try:
+        with os.scandir(root) as it:
+            entries = list(it)
+    except OSError:
+        return
+    subdirs: list[str] = []
+    for e in entries:
+        try:
+            is_dir = e.is_dir()
+        except OSError:
+            is_dir = False
+        if not is_dir:
+            yield e
+        elif recurse and not e.is_symlink():
+            subdirs.append(e.path)
+    for d in subdirs:
+        yield from _iter_files(d)
+
 def scan_folder(root: str,
                 folder_map: dict[str, str] | None = None,
                 recurse: bool = True,
@@ -722,60 +832,49 @@ def scan_folder(root: str,
     """
     ignore_exts = ignore_exts or set()
     ignore_name_contains = ignore_name_contains or []
-    files: list[str] = []
-
-    for r, dnames, fnames in os.walk(root):
-        for fn in fnames:
-            files.append(os.path.join(r, fn))
-        if not recurse:
-            break
+    # Only progress reporting needs the total up front; otherwise stream entries
+    files = _iter_files(root, recurse)
+    total = 0
+    if progress_cb:
+        files = list(files)
+        total = len(files)
+    # Entry paths are joined onto root verbatim, so cutting the prefix
+    # matches os.path.relpath without its abspath/split work per file.
+    root_prefix = root if root.endswith((os.sep, os.altsep or os.sep)) else root + os.sep
+    cut = len(root_prefix)
 
     out: list[FileItem] = []
-    total = len(files)
+    # folder_map/folder_slots are fixed for the scan: resolve each category once
+    target_for: dict[str, str] = {}
+
+    for i, entry in enumerate(files, 1):
+        fpath = entry.path
+        fname = entry.name
+        low = fname.lower()
+        ext, disabled = detect_real_ext(fname)
+
+        if ext and not ext.startswith("."):
+            ext = "." + ext
+        if ext in ignore_exts:
+            if progress_cb: progress_cb(i, total, fpath, "ignored_ext")
+            continue
+        if any(tok in low for tok in ignore_name_contains):
+            if progress_cb: progress_cb(i, total, fpath, "ignored_name")
+            continue
 
-    for i, fpath in enumerate(files, 1):
+        # Only file access (binary probe, relpath across drives, stat) can fail
         try:
-            fname = os.path.basename(fpath)
-            low = fname.lower()
-            ext, disabled = detect_real_ext(fname)
-
-            if ext and not ext.startswith("."):
-                ext = "." + ext
-            if ext in ignore_exts:
-                if progress_cb: progress_cb(i, total, fpath, "ignored_ext")
-                continue
-            if any(tok in low for tok in ignore_name_contains):
-                if progress_cb: progress_cb(i, total, fpath, "ignored_name")
-                continue
-
             cat, conf, notes = classify_file(
                 fpath, fname, ext, order=detector_order or DEFAULT_DETECTOR_ORDER,
                 enable_binary=use_binary_scan
             )
-            rel = os.path.relpath(fpath, root)
-            cat, conf, notes = _boost_from_parent_dirs(rel, (cat, conf, notes))
-            if disabled:
-                notes = (notes + "; disabled (.off)").strip("; ")
-
-            target = map_type_to_folder(cat, folder_map, folder_slots)
-            out.append(FileItem(
-                path=fpath,
-                name=fname,
-                ext=ext,
-                size_mb=human_mb(os.path.getsize(fpath)),
-                relpath=os.path.relpath(fpath, root),
-                guess_type=cat,
-                confidence=conf,
-                notes=notes,
-                include=(not disabled),
-                target_folder=target,
-            ))
-            if progress_cb: progress_cb(i, total, fpath, "ok")
+            rel = fpath[cut:] if fpath.startswith(root_prefix) else os.path.relpath(fpath, root)
+            size = entry.stat().st_size
         except Exception as e:
             out.append(FileItem(
                 path=fpath,
-                name=os.path.basename(fpath),
-                ext=os.path.splitext(fpath)[1].lower(),
+                name=fname,
+                ext=_split_name_ext(fname)[1].lower(),
                 size_mb=0.0,
                 relpath=os.path.relpath(fpath, root) if os.path.isdir(root) else "",
                 guess_type="Unknown",
@@ -785,10 +884,36 @@ def scan_folder(root: str,
                 target_folder=map_type_to_folder("Unknown", folder_map, folder_slots),
             ))
             if progress_cb: progress_cb(i, total, fpath, "error")
+            continue
 
-    out.sort(key=lambda fi: (
-        CATEGORY_ORDER.index(fi.guess_type) if fi.guess_type in CATEGORY_ORDER else 999,
-        os.path.dirname(fi.relpath).lower(),
+        cat, conf, notes = _boost_from_parent_dirs(rel, (cat, conf, notes))
+        if disabled:
+            notes = (notes + "; disabled (.off)").strip("; ")
+
+        target = target_for.get(cat)
+        if target is None:
+            target = target_for[cat] = map_type_to_folder(cat, folder_map, folder_slots)
+        out.append(FileItem(
+            path=fpath,
+            name=fname,
+            ext=ext,
+            size_mb=human_mb(size),
+            relpath=rel,
+            guess_type=cat,
+            confidence=conf,
+            notes=notes,
+            include=(not disabled),
+            target_folder=target,
+        ))
+        if progress_cb: progress_cb(i, total, fpath, "ok")
+
+    # Sort by (category rank, folder, name) using one flat "rank\0dir\0name"
+    # string per item: a single C string compare instead of a tuple compare.
+    # NUL sorts before any path character, so the order matches the tuple's.
+    rank, dirname = CATEGORY_RANK.get, os.path.dirname
+    out.sort(key=lambda fi: "%03d\0%s\0%s" % (
+        rank(fi.guess_type, 999),
+        dirname(fi.relpath).lower(),
         fi.name.lower(),
     ))
     return out
@@ -800,15 +925,20 @@ def bundle_scripts_and_packages(items: list[FileItem]) -> None:
     the script's target folder (so pairs live together). Adds a small note.
     """
     by_stem_scripts: dict[str, FileItem] = {}
+    packages: list[FileItem] = []
     for it in items:
         if it.ext == ".ts4script":
-            stem = os.path.splitext(it.name)[0].lower()
+            stem = _split_name_ext(it.name)[0].lower()
             by_stem_scripts[stem] = it
+        elif it.ext == ".package":
+            packages.append(it)
 
-    for it in items:
-        if it.ext != ".package":
-            continue
-        stem = os.path.splitext(it.name)[0].lower()
+    # No scripts → nothing can pair; skip the package pass entirely
+    if not by_stem_scripts:
+        return
+
+    for it in packages:
+        stem = _split_name_ext(it.name)[0].lower()
         s = by_stem_scripts.get(stem)
         if not s:
             continue
@@ -823,6 +953,9 @@ def _unique_path(p: str) -> str:
         out = f"{base} ({i}){ext}"; i += 1
     return out
 
+# Files that must stay where they are in the Mods root
+_FLATTEN_SKIP_NAMES = frozenset({"resource.cfg", LOG_NAME.lower(), LEGACY_LOG_NAME.lower()})
+
 def flatten_and_clean_mods_root(mods_root: str,
                                 folder_slots: dict[str, str],
                                 use_binary_scan: bool = True) -> dict:
@@ -836,7 +969,7 @@ def flatten_and_clean_mods_root(mods_root: str,
 
     for root, dirs, files in os.walk(mods_root, topdown=False):
         for fn in files:
-            if fn.lower() in {"resource.cfg", LOG_NAME.lower()}:
+            if fn.lower() in _FLATTEN_SKIP_NAMES:
                 continue
             src = os.path.join(root, fn)
             ext, _ = detect_real_ext(fn)
@@ -866,7 +999,7 @@ def flatten_and_clean_mods_root(mods_root: str,
 
 # Synonyms/case-fixes for top-level folder names → desired name
 # (Final names should match your DEFAULT_FOLDER_MAP values.)
-_NORMALISE_DIRS = {
+_NORMALISE_DIRS_RAW = {
     "script mod": "Script Mods", "script mods": "Script Mods",
     "gameplay mod": "Gameplay Mods", "gameplay mods": "Gameplay Mods",
     "gameplay tuning": "Gameplay Tuning",
@@ -887,7 +1020,7 @@ _NORMALISE_DIRS = {
     "colliding mods": COLLIDING_DIR_NAME,
 }
 
-_NORMALISE_DIRS.update({
+_NORMALISE_DIRS_RAW.update({
     "mcc": "MCC", "mc command center": "MCC", "frameworks": "MCC", "core mods": "MCC",
     "ui cheats": "UI Cheats", "cheats": "UI Cheats", "ui mods": "UI Cheats",
     "cas": "CAS", "create a sim": "CAS",
@@ -895,9 +1028,10 @@ _NORMALISE_DIRS.update({
     "gameplay": "Gameplay", "game mods": "Gameplay",
     "animation": "Animations", "animations": "Animations", "poses": "Animations", "pose": "Animations",
 })
+_NORMALISE_DIRS: Mapping[str, str] = MappingProxyType(_NORMALISE_DIRS_RAW)
 
 def _normalise_key(s: str) -> str:
-    return re.sub(r"\s+", " ", s.replace("_"," ").replace("-"," ").strip().lower())
+    return _WS_RE.sub(" ", s.replace("_"," ").replace("-"," ").strip().lower())
 
 def _merge_or_rename_dir(src_dir: str, dst_dir: str) -> tuple[int,int]:
     """If dst exists, merge src into dst; else rename src→dst. Returns (moved_files, removed_dirs)."""
@@ -1029,47 +1163,95 @@ def purge_empty_dirs(mods_root: str) -> int:
 
 # ---- Move executor + logging + undo
 
-def perform_moves(items: list[FileItem], mods_root: str) -> tuple[int,int,list[tuple[str,str,str]],list[dict]]:
+def perform_moves(items: list[FileItem], mods_root: str,
+                  progress_cb=None) -> tuple[int,int,list[tuple[str,str,str]],list[dict]]:
     """
     Move included items to their target folders.
+    progress_cb(done, total) is called after each item.
     Returns (moved_count, skipped_count, collisions, move_logs).
     """
     moved = skipped = 0
+    total = len(items)
     collisions: list[tuple[str,str,str]] = []
     logs: list[dict] = []
+    # folder → normcased names present there (one listdir per folder, not a stat per move).
+    # Keyed on the normalised path: target folders are free text, so "CAS", "cas" or a
+    # trailing separator must share one set, or a stale set would miss a real collision.
+    dir_names: dict[str, set[str]] = {}
 
-    for it in items:
+    for i, it in enumerate(items, start=1):
         if not it.include:
             skipped += 1
-            continue
-        dest_dir = os.path.join(mods_root, it.target_folder)
-        ensure_folder(dest_dir)
-        dest = os.path.join(dest_dir, it.name)
-        if os.path.exists(dest):
-            collisions.append((it.path, dest, "name collision"))
-            continue
-        dest = _unique_path(dest)
-        shutil.move(it.path, dest)
-        logs.append({"from": it.path, "to": dest})
-        moved += 1
+        else:
+            dest_dir = os.path.join(mods_root, it.target_folder)
+            dir_key = os.path.normcase(os.path.normpath(dest_dir))
+            names = dir_names.get(dir_key)
+            if names is None:
+                ensure_folder(dest_dir)
+                names = dir_names[dir_key] = {os.path.normcase(n) for n in os.listdir(dest_dir)}
+            dest = os.path.join(dest_dir, it.name)
+            key = os.path.normcase(it.name)
+            if key in names:
+                collisions.append((it.path, dest, "name collision"))
+            else:
+                shutil.move(it.path, dest)
+                names.add(key)
+                # The name has left its old folder; if that folder is cached, free it there
+                src_names = dir_names.get(os.path.normcase(os.path.normpath(os.path.dirname(it.path))))
+                if src_names is not None:
+                    src_names.discard(key)
+                logs.append({"from": it.path, "to": dest})
+                moved += 1
+        if progress_cb: progress_cb(i, total)
 
     return moved, skipped, collisions, logs
 
 def save_moves_log(mods_root: str, logs: list[dict]) -> None:
-    """Append this batch to the move log JSON (used by Undo)."""
+    """Append this batch as one JSON line to the move log (used by Undo)."""
     if not logs:
         return
     path = os.path.join(mods_root, LOG_NAME)
-    data = []
-    if os.path.exists(path):
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps({"ts": time.time(), "ops": logs}) + "\n")
+
+def _last_jsonl_record(path: str) -> tuple[int, dict] | None:
+    """
+    Read the last non-empty line of a JSONL file from the end.
+    Returns (offset where that line starts, parsed record), or None if empty.
+    """
+    with open(path, "rb") as f:
+        pos = f.seek(0, os.SEEK_END)
+        buf = b""
+        step = 4096
+        while pos > 0:
+            step = min(step, pos)
+            pos -= step
+            f.seek(pos)
+            buf = f.read(step) + buf
+            line_end = len(buf.rstrip())
+            nl = buf.rfind(b"\n", 0, line_end)
+            if nl != -1:
+                return pos + nl + 1, json.loads(buf[nl + 1:line_end])
+            step *= 2
+        if not buf.strip():
+            return None
+        return 0, json.loads(buf)
+
+def _undo_ops(ops: list[dict]) -> int:
+    """Move each op's 'to' back to 'from' (newest first). Returns files restored."""
+    undone = 0
+    for op in reversed(ops):
+        src = op.get("from")
+        dst = op.get("to")
+        if not dst or not os.path.exists(dst):
+            continue
+        ensure_folder(os.path.dirname(src))
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            shutil.move(dst, src)
+            undone += 1
         except Exception:
-            data = []
-    data.append({"ts": time.time(), "ops": logs})
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
+            pass
+    return undone
 
 def undo_last_move(mods_root: str) -> str:
     """
@@ -1077,10 +1259,24 @@ def undo_last_move(mods_root: str) -> str:
     Returns a short human-readable message.
     """
     path = os.path.join(mods_root, LOG_NAME)
-    if not os.path.exists(path):
-        return "No move log found."
+    if os.path.exists(path):
+        try:
+            found = _last_jsonl_record(path)
+        except Exception:
+            return "Move log unreadable."
+        if found:
+            offset, last = found
+            undone = _undo_ops(last.get("ops", []))
+            # Drop the batch we just undid
+            os.truncate(path, offset)
+            return f"Undid {undone} file(s)."
+
+    # Older installs kept history as one JSON list
+    legacy = os.path.join(mods_root, LEGACY_LOG_NAME)
+    if not os.path.exists(legacy):
+        return "Move log empty." if os.path.exists(path) else "No move log found."
     try:
-        with open(path, "r", encoding="utf-8") as f:
+        with open(legacy, "r", encoding="utf-8") as f:
             data = json.load(f)
     except Exception:
         return "Move log unreadable."
@@ -1089,21 +1285,9 @@ def undo_last_move(mods_root: str) -> str:
         return "Move log empty."
 
     last = data.pop()
-    undone = 0
+    undone = _undo_ops(last.get("ops", []))
 
-    for op in reversed(last.get("ops", [])):
-        src = op.get("from")
-        dst = op.get("to")
-        if not dst or not os.path.exists(dst):
-            continue
-        ensure_folder(os.path.dirname(src))
-        try:
-            shutil.move(dst, src)
-            undone += 1
-        except Exception:
-            pass
-
-    with open(path, "w", encoding="utf-8") as f:
+    with open(legacy, "w", encoding="utf-8") as f:
         json.dump(data, f, indent=2)
     return f"Undid {undone} file(s)."
 
@@ -1112,17 +1296,31 @@ def undo_last_move(mods_root: str) -> str:
 # =========================
 
 # ---- Settings persistence
+_settings_blob: str | None = None  # text last read from / written to CONFIG_PATH
+
 def load_settings() -> dict:
+    global _settings_blob
     try:
         with open(CONFIG_PATH, "r", encoding="utf-8") as f:
-            return json.load(f)
+            text = f.read()
+        cfg = json.loads(text)
+        _settings_blob = text
+        return cfg
     except Exception:
         return {}
 
 def save_settings(cfg: dict) -> None:
+    """Write settings atomically (temp file + os.replace); no-op if nothing changed."""
+    global _settings_blob
     try:
-        with open(CONFIG_PATH, "w", encoding="utf-8") as f:
-            json.dump(cfg, f, indent=2)
+        blob = json.dumps(cfg, indent=2)
+        if blob == _settings_blob:
+            return
+        tmp = CONFIG_PATH + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(blob)
+        os.replace(tmp, CONFIG_PATH)
+        _settings_blob = blob
     except Exception:
         pass
 
@@ -1168,7 +1366,18 @@ class Sims4ModSorterApp(tk.Tk):
         self.scan_eta_var   = tk.StringVar(value="ETA —")
         self.cur_file_var   = tk.StringVar(value="")
         self.autoscroll_var = tk.BooleanVar(value=True)
+        self._log_buf: deque[tuple[str, str]] = deque()   # (line, level) waiting for _flush_log
+        self._log_flush_job = None
         self._filtered_items: list[FileItem] | None = None
+        self._search_blobs: list[str] | None = None  # parallel to self.items; None = rebuild
+        self._iid_to_item: dict[str, FileItem] = {}   # filled by _refresh_tree
+        self._items_rev = 0    # bumped whenever self.items or a row's fields change
+        self._tree_rev = -1    # revision the tree rows were last built from
+        self._summary_cache: tuple[int, str] | None = None  # (rev, summary text)
+        self._row_vals: list[tuple] = []  # values shown per tree row (iid = index)
+        self._refresh_gen = 0     # bumped per _refresh_tree; stale slices stop
+        self._col_fill_gen = 0    # bumped per collision toggle; stale fills stop
+        self._resize_job = None   # pending _do_resize after-id
         self._respect_user_widths = bool(cfg.get("col_widths"))
 
         # Build UI
@@ -1187,7 +1396,7 @@ class Sims4ModSorterApp(tk.Tk):
         self.after(50, self._clamp_initial_layout)
 
         # keep panes sensible while the user resizes
-        self.bind("<Configure>", lambda e: self._on_resize())
+        self.bind("<Configure>", self._on_resize)
 
         # save geometry on close
         self.protocol("WM_DELETE_WINDOW", self._on_close)
@@ -1403,9 +1612,9 @@ class Sims4ModSorterApp(tk.Tk):
         ttk.Button(right, text="Recalculate Targets",    style="App.TButton",
                    command=self.on_recalc_targets).pack(fill="x", pady=4)
         ttk.Button(right, text="Select All",             style="App.TButton",
-                   command=lambda: self.tree.selection_set(self.tree.get_children())).pack(fill="x", pady=2)
+                   command=self._select_all_rows).pack(fill="x", pady=2)
         ttk.Button(right, text="Select None",            style="App.TButton",
-                   command=lambda: self.tree.selection_remove(self.tree.get_children())).pack(fill="x", pady=2)
+                   command=self._select_no_rows).pack(fill="x", pady=2)
 
         # --- Scan strip (counters + ETA) ----------------------------------------
         strip = ttk.Frame(self); strip.pack(fill="x", padx=12, pady=(4, 0))
@@ -1437,10 +1646,7 @@ class Sims4ModSorterApp(tk.Tk):
         toolbar = ttk.Frame(logf); toolbar.pack(fill="x", pady=(0, 4))
         ttk.Label(toolbar, text="Logs").pack(side="left")
         ttk.Button(toolbar, text="Clear", style="App.TButton",
-                   command=lambda: (self.log_text.configure(state="normal"),
-                                    self.log_text.delete("1.0", "end"),
-                                    self.log_text.configure(state="disabled"))
-                   ).pack(side="right", padx=(0, 8))
+                   command=self._clear_log).pack(side="right", padx=(0, 8))
         ttk.Checkbutton(toolbar, text="Auto-scroll", variable=self.autoscroll_var).pack(side="right")
 
         self.log_text = tk.Text(logf, height=8, wrap="word", state="disabled", relief="flat",
@@ -1481,7 +1687,7 @@ class Sims4ModSorterApp(tk.Tk):
         hdr = ttk.Frame(self._settings_card); hdr.pack(fill="x", padx=20, pady=(14, 6))
         ttk.Label(hdr, text="Settings", font=("Segoe UI", 12, "bold")).pack(side="left")
         ttk.Button(hdr, text="×", width=3, style="App.TButton",
-                   command=lambda: self.toggle_settings(False)).pack(side="right")
+                   command=self._close_settings).pack(side="right")
 
         # ----- Scrollable body (vertical)
         body_wrap = tk.Frame(self._settings_card, bg=c["alt"])
@@ -1610,10 +1816,9 @@ class Sims4ModSorterApp(tk.Tk):
         # Footer
         ftr = ttk.Frame(content); ftr.pack(fill="x", pady=(16, 10))
         ttk.Button(ftr, text="Cancel", style="App.TButton",
-                   command=lambda: self.toggle_settings(False)).pack(side="right")
+                   command=self._close_settings).pack(side="right")
         ttk.Button(ftr, text="Save & Close", style="App.Accent.TButton",
-                   command=lambda: (self._read_detector_order(), self._refresh_target_cb_values(), self._save_live_settings(), self.toggle_settings(False))
-                   ).pack(side="right", padx=8)
+                   command=self._save_and_close_settings).pack(side="right", padx=8)
 
         # Make sure colours apply to this overlay right now
         self._settings_theme_refresh()
@@ -1631,6 +1836,15 @@ class Sims4ModSorterApp(tk.Tk):
         else:
             self.overlay.place_forget()
 
+    def _close_settings(self, _event=None):
+        self.toggle_settings(False)
+
+    def _save_and_close_settings(self):
+        self._read_detector_order()
+        self._refresh_target_cb_values()
+        self._save_live_settings()
+        self.toggle_settings(False)
+
     def _reorder_detector(self, delta: int):
         lb = self.lb_det
         sel = lb.curselection()
@@ -1684,7 +1898,7 @@ class Sims4ModSorterApp(tk.Tk):
         btns = ttk.Frame(card); btns.pack(fill="x", padx=16, pady=(8,12))
         ttk.Button(btns, text="Protect Selected",   style="App.TButton", command=self._col_protect_selected).pack(side="left")
         ttk.Button(btns, text="Unprotect Selected", style="App.TButton", command=self._col_unprotect_selected).pack(side="left", padx=6)
-        ttk.Button(btns, text="Cancel",             style="App.TButton", command=lambda: self._toggle_collision(False)).pack(side="right")
+        ttk.Button(btns, text="Cancel",             style="App.TButton", command=self._close_collision).pack(side="right")
         ttk.Button(btns, text="Confirm & Resolve",  style="App.Accent.TButton", command=self._col_apply).pack(side="right", padx=6)
 
         self._collision_plan: list[dict] = []
@@ -1693,10 +1907,26 @@ class Sims4ModSorterApp(tk.Tk):
         """Show/hide the collision overlay and populate rows."""
         if show:
             self._collision_plan = plan or []
-            # clear
-            for r in self.col_tree.get_children():
-                self.col_tree.delete(r)
-            # populate
+            strftime, localtime = time.strftime, time.localtime
+            basename, dirname = os.path.basename, os.path.dirname
+
+            # The label has minute resolution, so rows stamped in the same minute share one strftime
+            by_minute: dict[int, str] = {}
+
+            def _fmt(ts: float) -> str:
+                try:
+                    if ts:
+                        minute = int(ts) // 60
+                        out = by_minute.get(minute)
+                        if out is None:
+                            out = by_minute[minute] = strftime("%Y-%m-%d %H:%M", localtime(ts))
+                        return out
+                except Exception:
+                    pass
+                return "unknown"
+
+            # build every row in Python first, then touch Tk
+            rows = []
             for i, p in enumerate(self._collision_plan):
                 if p["older"] == "src":
                     older, newer = p["src"], p["dst"]
@@ -1704,30 +1934,36 @@ class Sims4ModSorterApp(tk.Tk):
                 else:
                     older, newer = p["dst"], p["src"]
                     older_ts, newer_ts = p["dst_ts"], p["src_ts"]
-
-                def _fmt(ts: float) -> str:
-                    try:
-                        if ts:
-                            return time.strftime("%Y-%m-%d %H:%M", time.localtime(ts))
-                    except Exception:
-                        pass
-                    return "unknown"
-
-                self.col_tree.insert(
-                    "", "end", iid=str(i),
-                    values=("Yes" if p.get("protect") else "No",
-                            os.path.basename(older), _fmt(older_ts),
-                            os.path.basename(newer), _fmt(newer_ts),
-                            os.path.dirname(p["dst"]))
-                )
+                rows.append((str(i), ("Yes" if p.get("protect") else "No",
+                                      basename(older), _fmt(older_ts),
+                                      basename(newer), _fmt(newer_ts),
+                                      dirname(p["dst"]))))
+
+            # clear in one call, then populate: the first screenful now, the rest
+            # in slices so a huge plan never stalls the event loop
+            self.col_tree.delete(*self.col_tree.get_children())
+            self._col_fill_gen += 1
+            self._col_fill(rows, 0, self._col_fill_gen)
             self._col_overlay.place(relx=0, rely=0, relwidth=1, relheight=1)
             # centre card with sane width
             w = max(720, min(self.winfo_width()-160, 1000))
             self._col_card.configure(width=w)
             self._col_card.place_configure(relx=0.5, rely=0.5)
         else:
+            self._col_fill_gen += 1  # stop pending fills
             self._col_overlay.place_forget()
 
+    def _col_fill(self, rows: list, start: int, gen: int, chunk: int = 200):
+        """Insert rows[start:start+chunk] into the collision tree, then reschedule."""
+        if gen != self._col_fill_gen:
+            return
+        insert = self.col_tree.insert
+        end = min(start + chunk, len(rows))
+        for iid, vals in rows[start:end]:
+            insert("", "end", iid=iid, values=vals)
+        if end < len(rows):
+            self.after(1, self._col_fill, rows, end, gen)
+
     def _theme_chip_clicked(self, name: str):
         """Select a theme tile, live-preview it, and persist the variable."""
         var = getattr(self, "theme_name", None) or getattr(self, "theme_var", None)
@@ -1920,14 +2156,53 @@ def _safe_now():
     except Exception:
         return ""
 
-def _uniq_name_in(folder: str, name: str) -> str:
+def _uniq_name_in(folder: str, name: str,
+                  existing: set[str] | None = None,
+                  counters: dict[str, int] | None = None) -> str:
+    """
+    Free path for *name* inside *folder*, adding " (n)" before the extension.
+    With *existing* (normcased names already in folder) and *counters*, the
+    search runs in memory and the chosen name is recorded, so repeated calls
+    for the same folder cost no stats.
+    """
+    if existing is None:
+        base, ext = os.path.splitext(name)
+        i = 1
+        out = os.path.join(folder, name)
+        while os.path.exists(out):
+            out = os.path.join(folder, f"{base} ({i}){ext}")
+            i += 1
+        return out
+
+    key = os.path.normcase(name)
+    if key not in existing:
+        existing.add(key)
+        return os.path.join(folder, name)
     base, ext = os.path.splitext(name)
-    i = 1
-    out = os.path.join(folder, name)
-    while os.path.exists(out):
-        out = os.path.join(folder, f"{base} ({i}){ext}")
+    i = counters.get(key, 1) if counters is not None else 1
+    cand = f"{base} ({i}){ext}"
+    while os.path.normcase(cand) in existing:
         i += 1
-    return out
+        cand = f"{base} ({i}){ext}"
+    if counters is not None:
+        counters[key] = i + 1
+    existing.add(os.path.normcase(cand))
+    return os.path.join(folder, cand)
+
+_FILTER_SPLIT_RE = re.compile(r"[ ,;]+")
+
+# Row formatting lookups for the plan tree
+_INC_LUT = ("", "✓")          # indexed by FileItem.include
+_fmt2 = "%.2f".__mod__        # MB / Conf cells
+
+# Row iids are list indices as strings; reuse one interned str per index across refreshes
+_IID_POOL: list[str] = []
+
+def _iid(i: int) -> str:
+    n = len(_IID_POOL)
+    if i >= n:
+        _IID_POOL.extend(sys.intern(str(k)) for k in range(n, i + 64))
+    return _IID_POOL[i]
 
 def _norm_ignore_exts(s: str) -> set[str]:
     out = set()
@@ -1949,23 +2224,54 @@ def _norm_ignore_names(s: str) -> list[str]:
     return out
 
 def _flatten_notes(text: str) -> str:
-    return "; ".join(p.strip() for p in re.split(r"[;\n]+", str(text or "")) if p.strip())
+    """Join ';'/newline-separated note parts into one "a; b" line for a single cell."""
+    raw = str(text or "")
+    if ";" not in raw and "\n" not in raw:
+        return raw.strip()
+    return "; ".join(q for p in raw.replace("\n", ";").split(";") if (q := p.strip()))
 
 class Sims4ModSorterApp(Sims4ModSorterApp):  # extend with handlers
     # ---- utility UI methods
 
     def log(self, msg: str, level: str = "INFO"):
-        """Append a one-line message to the log pane with colour tags."""
+        """Queue a one-line message for the log pane; lines are flushed in batches."""
         level = level.upper()
         line = f"[{time.strftime('%H:%M:%S')}] {msg}\n"
+        self._log_buf.append((line, level if level in {"OK","INFO","WARN","ERR"} else "INFO"))
+        if self._log_flush_job is None:
+            self._log_flush_job = self.after(100, self._flush_log)
+
+    def _flush_log(self):
+        """Write all queued log lines with one insert and one state toggle."""
+        self._log_flush_job = None
+        buf = self._log_buf
+        if not buf:
+            return
+        # Text.insert takes alternating chars/tags pairs, so the batch is one Tcl call
+        args: list = []
+        while buf:
+            line, level = buf.popleft()
+            args += (line, (level,))
         self.log_text.configure(state="normal")
         try:
-            self.log_text.insert("end", line, (level if level in {"OK","INFO","WARN","ERR"} else "INFO",))
+            self.log_text.insert("end", *args)
             if self.autoscroll_var.get():
                 self.log_text.see("end")
         finally:
             self.log_text.configure(state="disabled")
 
+    def _clear_log(self):
+        self._log_buf.clear()
+        self.log_text.configure(state="normal")
+        self.log_text.delete("1.0", "end")
+        self.log_text.configure(state="disabled")
+
+    def _select_all_rows(self):
+        self.tree.selection_set(self.tree.get_children())
+
+    def _select_no_rows(self):
+        self.tree.selection_remove(self.tree.get_children())
+
     # ---- Handlers
 
     def on_browse(self):
@@ -1985,34 +2291,45 @@ class Sims4ModSorterApp(Sims4ModSorterApp):  # extend with handlers
             messagebox.showerror("Scan", "Mods folder not found.")
             return
 
-        # Pre-count files to set a correct maximum and nicer ETA
-        total = 0
-        for r, d, f in os.walk(mods):
-            total += len(f)
-            if not self.recurse_var.get():
-                break
-        self._progress_reset(total or 1)
+        # The scanner reports the real total with its first callback
+        self._progress_reset(0)
         self.items = []
+        self._items_rev += 1
         self.status_var.set("Starting scan…")
         self.log("Scan started.", "INFO")
 
+        # Tally on the scanner thread; post to Tk at most ~20×/s plus the final file
+        counts = {"ok": 0, "ignored": 0, "error": 0}
+        last_ui = 0.0
+
         def progress_cb(done, total_cb, path, state):
             # state from scanner: "ok", "ignored_ext", "ignored_name", "error"
-            self.after(0, lambda d=done, t=total_cb, p=path, s=("ignored" if state.startswith("ignored") else state):
-                             self._progress_update_ui(d, t or total, p, s))
+            nonlocal last_ui
+            key = "ignored" if state.startswith("ignored") else state
+            counts[key] = counts.get(key, 0) + 1
+            now = time.monotonic()
+            if done != total_cb and now - last_ui < 0.05:
+                return
+            last_ui = now
+            self.after(0, lambda d=done, t=total_cb, p=path,
+                             c=(counts["ok"], counts["ignored"], counts["error"]):
+                             self._progress_update_ui(d, t, p, *c))
 
-        def worker():
-            ignore_exts = _norm_ignore_exts(self.ignore_exts_var.get())
-            ignore_names = _norm_ignore_names(self.ignore_names_var.get())
+        # Read the Tk variables once, here on the UI thread, not from the worker
+        ignore_exts = _norm_ignore_exts(self.ignore_exts_var.get())
+        ignore_names = _norm_ignore_names(self.ignore_names_var.get())
+        recurse = bool(self.recurse_var.get())
+        use_binary = bool(self.use_binary_scan.get())
 
+        def worker():
             items = scan_folder(
                 mods,
                 folder_map=self.folder_map,
-                recurse=self.recurse_var.get(),
+                recurse=recurse,
                 ignore_exts=ignore_exts,
                 ignore_name_contains=ignore_names,
                 detector_order=self.detector_order,
-                use_binary_scan=bool(self.use_binary_scan.get()),
+                use_binary_scan=use_binary,
                 progress_cb=progress_cb,
                 folder_slots=self.folder_slots,
             )
@@ -2020,7 +2337,9 @@ class Sims4ModSorterApp(Sims4ModSorterApp):  # extend with handlers
 
             def ui_done():
                 self.items = items
+                self._items_rev += 1
                 self._filtered_items = None
+                self._search_blobs = None
                 self._progress_finish(had_errors=(self.scan_errors > 0))
                 self.summary_var.set(f"Scan complete: {len(self.items)} file(s)")
                 self._refresh_tree()
@@ -2047,23 +2366,35 @@ class Sims4ModSorterApp(Sims4ModSorterApp):  # extend with handlers
             self._filtered_items = None
             self._refresh_tree()
             return
-        toks = [t for t in re.split(r"[ ,;]+", q) if t]
+        toks = [t for t in _FILTER_SPLIT_RE.split(q) if t]
         if not toks:
             self._filtered_items = None
             self._refresh_tree()
             return
 
-        def match(it: FileItem) -> bool:
-            blob = " ".join([it.name.lower(),
-                             os.path.dirname(it.relpath or "").lower(),
-                             str(it.ext).lower(),
-                             str(it.guess_type).lower(),
-                             (it.notes or "").lower()])
-            return all(t in blob for t in toks)
-
-        self._filtered_items = [it for it in self.items if match(it)]
+        blobs = self._item_search_blobs()
+        if len(toks) == 1:
+            tok = toks[0]
+            self._filtered_items = [it for it, blob in zip(self.items, blobs) if tok in blob]
+        else:
+            self._filtered_items = [it for it, blob in zip(self.items, blobs)
+                                    if all(t in blob for t in toks)]
         self._refresh_tree()
 
+    def _item_search_blobs(self) -> list[str]:
+        """Lower-cased filter text per item, rebuilt only after the plan changes."""
+        blobs = self._search_blobs
+        if blobs is None or len(blobs) != len(self.items):
+            blobs = self._search_blobs = [
+                " ".join([it.name.lower(),
+                          os.path.dirname(it.relpath or "").lower(),
+                          str(it.ext).lower(),
+                          str(it.guess_type).lower(),
+                          (it.notes or "").lower()])
+                for it in self.items
+            ]
+        return blobs
+
     def on_select(self, event=None):
         """Reflect selection into the right-hand editor."""
         sel = self.tree.selection()
@@ -2078,7 +2409,7 @@ class Sims4ModSorterApp(Sims4ModSorterApp):  # extend with handlers
             if idx < 0 or idx >= len(src):
                 return
             it = src[idx]
-            self.type_cb.set(it.guess_type if it.guess_type in CATEGORY_ORDER else "")
+            self.type_cb.set(it.guess_type if it.guess_type in CATEGORY_RANK else "")
             self.target_entry.delete(0, tk.END)
             self.target_entry.insert(0, it.target_folder)
 
@@ -2110,13 +2441,10 @@ class Sims4ModSorterApp(Sims4ModSorterApp):  # extend with handlers
             messagebox.showinfo("Apply to Selected", "Choose a Type and/or Target Folder first.")
             return
 
-        items_src = self._filtered_items if self._filtered_items is not None else self.items
-        key_to_item = { (os.path.dirname(it.relpath).replace("\\","/") or ".", it.name): it for it in items_src }
-
+        row_item = self._iid_to_item.get
         changed = 0
         for iid in sel:
-            key = (self.tree.set(iid, "rel"), self.tree.set(iid, "name"))
-            it = key_to_item.get(key)
+            it = row_item(iid)
             if not it: continue
             if new_type:
                 it.guess_type = new_type
@@ -2127,8 +2455,10 @@ class Sims4ModSorterApp(Sims4ModSorterApp):  # extend with handlers
             changed += 1
 
         if changed:
+            self._items_rev += 1
+            self._search_blobs = None
             self._refresh_tree_rows()
-            self._log("OK", f"Applied to {changed} selected row(s).")
+            self.log(f"Applied to {changed} selected row(s).", "OK")
 
     def on_toggle_include(self):
         """Toggle Include flag for selected rows."""
@@ -2142,6 +2472,7 @@ class Sims4ModSorterApp(Sims4ModSorterApp):  # extend with handlers
                 continue
             it = src[idx]
             it.include = not it.include
+        self._items_rev += 1
         self._refresh_tree(preserve_selection=True)
 
     def _open_batch_assign_dialog(self):
@@ -2185,9 +2516,8 @@ class Sims4ModSorterApp(Sims4ModSorterApp):  # extend with handlers
             messagebox.showinfo("Batch Assign", "Choose a Type and/or Target Folder first.")
             return
 
-        # Helper: build key → FileItem mapping using (Folder, File) from the tree
         items_src = self._filtered_items if self._filtered_items is not None else self.items
-        key_to_item = { (os.path.dirname(it.relpath).replace("\\","/") or ".", it.name): it for it in items_src }
+        row_item = self._iid_to_item.get
 
         scope = getattr(self, "batch_scope_var", None)
         scope = scope.get() if scope else "selected"
@@ -2197,15 +2527,15 @@ class Sims4ModSorterApp(Sims4ModSorterApp):  # extend with handlers
 
         if scope == "selected":
             for iid in self.tree.selection():
-                key = (self.tree.set(iid, "rel"), self.tree.set(iid, "name"))
-                it = key_to_item.get(key)
+                it = row_item(iid)
                 if it: target_items.append(it)
 
         elif scope == "same-type":
             sel = self.tree.selection()
             if not sel:
                 messagebox.showinfo("Batch Assign", "Select at least one row first."); return
-            first_type = self.tree.set(sel[0], "type")
+            first = row_item(sel[0])
+            first_type = first.guess_type if first else self.tree.set(sel[0], "type")
             target_items = [it for it in items_src if it.guess_type == first_type]
 
         else:  # visible
@@ -2224,17 +2554,28 @@ class Sims4ModSorterApp(Sims4ModSorterApp):  # extend with handlers
             changed += 1
 
         if changed:
+            self._items_rev += 1
+            self._search_blobs = None
             self._refresh_tree_rows()
-            self._log("OK", f"Batch updated {changed} row(s).")
+            self.log(f"Batch updated {changed} row(s).", "OK")
 
     def on_recalc_targets(self) -> None:
         """Recalculate the Target folder from the current Type for all (visible) rows."""
         src = self._filtered_items if getattr(self, "_filtered_items", None) else self.items
+        target_for: dict[str, str] = {}  # one map lookup per category, not per row
+        changed = 0
         for it in src:
             # If you’re on the 6-folder layout with slots, use:
             # it.target_folder = map_type_to_folder(it.guess_type, None, self.folder_slots)
-            it.target_folder = map_type_to_folder(it.guess_type, self.folder_map)
-        self._refresh_tree_rows()
+            new = target_for.get(it.guess_type)
+            if new is None:
+                new = target_for[it.guess_type] = map_type_to_folder(it.guess_type, self.folder_map)
+            if it.target_folder != new:
+                it.target_folder = new
+                changed += 1
+        if changed:
+            self._items_rev += 1
+            self._refresh_tree_rows()
 
     def on_export_plan(self):
         # Export the currently visible plan (filtered if a filter is applied).
@@ -2252,26 +2593,42 @@ class Sims4ModSorterApp(Sims4ModSorterApp):  # extend with handlers
         if not path:
             return
 
-        try:
-            with open(path, "w", newline="", encoding="utf-8") as f:
-                writer = csv.writer(f)
-                writer.writerow(["Folder", "File", "Ext", "Type", "MB", "Target Folder", "Notes", "Conf", "Include"])
-                for it in items:
-                    writer.writerow([
-                        os.path.dirname(it.relpath).replace("\\", "/") or ".",
-                        prettify_for_ui(it.name),
-                        it.ext,
-                        it.guess_type,
-                        f"{it.size_mb:.2f}",
-                        it.target_folder,
-                        it.notes,
-                        f"{it.confidence:.2f}",
-                        "✓" if it.include else "✗",
-                    ])
-            self._log("OK", f"Exported plan → {path}")
-        except Exception as e:
-            self._log("ERR", f"Export failed: {e}")
-            messagebox.showerror("Export Plan", f"Could not write file:\n{e}")
+        items = list(items)  # snapshot the row list; a rescan replaces self.items
+
+        def worker():
+            try:
+                with open(path, "w", newline="", encoding="utf-8") as f:
+                    writer = csv.writer(f)
+                    writer.writerow(["Folder", "File", "Ext", "Type", "MB", "Target Folder", "Notes", "Conf", "Include"])
+                    pretty = prettify_for_ui
+                    writer.writerows(
+                        (
+                            it.rel_dir.replace("\\", "/"),
+                            pretty(it.name),
+                            it.ext,
+                            it.guess_type,
+                            f"{it.size_mb:.2f}",
+                            it.target_folder,
+                            it.notes,
+                            f"{it.confidence:.2f}",
+                            "✓" if it.include else "✗",
+                        )
+                        for it in items
+                    )
+                msg, err = f"Exported plan → {path}", None
+            except Exception as e:
+                msg, err = f"Export failed: {e}", e
+
+            def ui_done():
+                if err is None:
+                    self.log(msg, "OK")
+                else:
+                    self.log(msg, "ERR")
+                    messagebox.showerror("Export Plan", f"Could not write file:\n{err}")
+
+            self.after(0, ui_done)
+
+        threading.Thread(target=worker, daemon=True).start()
 
     def on_clean_folders(self, auto: bool = False):
         """Fix folder casing/names and remove empties. auto=True suppresses popups."""
@@ -2303,17 +2660,18 @@ class Sims4ModSorterApp(Sims4ModSorterApp):  # extend with handlers
         self.progress.configure(maximum=len(plan), value=0)
 
         def worker():
-            moved_total = skipped_total = 0
-            collisions_total: list[tuple[str,str,str]] = []
-            moves_log_all: list[dict] = []
-
-            for i, it in enumerate(plan, start=1):
-                moved, skipped, collisions, moves_log = perform_moves([it], mods)
-                moved_total += moved
-                skipped_total += skipped
-                collisions_total.extend(collisions)
-                moves_log_all.extend(moves_log)
-                self.after(0, lambda i=i: self.progress.configure(value=i))
+            last_ui = 0.0
+
+            def progress_cb(done, total):
+                # At most one progress-bar update per 50 ms, plus the final one
+                nonlocal last_ui
+                now = time.monotonic()
+                if done == total or now - last_ui >= 0.05:
+                    last_ui = now
+                    self.after(0, lambda d=done: self.progress.configure(value=d))
+
+            moved_total, skipped_total, collisions_total, moves_log_all = perform_moves(
+                plan, mods, progress_cb=progress_cb)
 
             save_moves_log(mods, moves_log_all)
 
@@ -2349,7 +2707,8 @@ class Sims4ModSorterApp(Sims4ModSorterApp):  # extend with handlers
         except Exception:
             pass
         self._respect_user_widths = True
-        cw = {c: int(self.tree.column(c)["width"]) for c in COLUMNS}
+        column = self.tree.column
+        cw = {c: int(column(c, "width")) for c in COLUMNS}
         s = load_settings(); s["col_widths"] = cw; save_settings(s)
 
     def _sort_by(self, col: str):
@@ -2365,7 +2724,7 @@ class Sims4ModSorterApp(Sims4ModSorterApp):  # extend with handlers
         col = getattr(self, "_sort_col", None)
         if not col: return 0
         if col == "name":   return prettify_for_ui(it.name).lower()
-        if col == "rel":    return (os.path.dirname(it.relpath or "") or ".").lower()
+        if col == "rel":    return it.rel_dir.lower()
         if col == "ext":    return (it.ext or "").lower()
         if col == "type":   return (it.guess_type or "").lower()
         if col == "size":   return float(getattr(it, "size_mb", 0.0))
@@ -2421,15 +2780,14 @@ class Sims4ModSorterApp(Sims4ModSorterApp):  # extend with handlers
         self.cur_file_var.set("")
         self.progress.configure(style="Scan.Horizontal.TProgressbar", maximum=max(1,total), value=0)
 
-    def _progress_update_ui(self, done: int, total: int, path: str, state: str):
-        # Counters
+    def _progress_update_ui(self, done: int, total: int, path: str,
+                            ok: int, ignored: int, errors: int):
+        # Counters (tallied by the scan thread; updates arrive throttled)
         self.scan_done = done
-        if state in ("ok",):
-            self.scan_ok += 1
-        elif state in ("ignored","ignored_ext","ignored_name"):
-            self.scan_ignored += 1
-        elif state in ("error",):
-            self.scan_errors += 1
+        if total != self.scan_total:
+            self.scan_total = total
+            self.progress.configure(maximum=max(1, total))
+        self.scan_ok, self.scan_ignored, self.scan_errors = ok, ignored, errors
 
         # ETA
         elapsed = max(0.001, time.time() - self.scan_started_at)
@@ -2455,6 +2813,9 @@ class Sims4ModSorterApp(Sims4ModSorterApp):  # extend with handlers
         
     # ---- Collision overlay actions
 
+    def _close_collision(self):
+        self._toggle_collision(False)
+
     def _col_protect_selected(self):
         for iid in self.col_tree.selection():
             i = int(iid)
@@ -2481,8 +2842,19 @@ class Sims4ModSorterApp(Sims4ModSorterApp):  # extend with handlers
         mods = self.mods_root.get()
         colliding_dir = os.path.join(mods, COLLIDING_DIR_NAME)
         ensure_folder(colliding_dir)
+        # Names already quarantined: one listdir, then suffixes are picked in memory
+        col_existing = {os.path.normcase(n) for n in os.listdir(colliding_dir)}
+        col_counters: dict[str, int] = {}
         moved_ops: list[dict] = []
 
+        # Hot-loop locals
+        basename, dirname = os.path.basename, os.path.dirname
+        abspath, commonpath, relpath = os.path.abspath, os.path.commonpath, os.path.relpath
+        exists, move, log = os.path.exists, shutil.move, self.log
+        record = moved_ops.append
+        mods_abs = abspath(mods)
+        ensured = {colliding_dir}  # folders already created this pass
+
         for p in list(self._collision_plan):
             src, dst = p.get("src"), p.get("dst")
             older_side = p.get("older")
@@ -2495,44 +2867,47 @@ class Sims4ModSorterApp(Sims4ModSorterApp):  # extend with handlers
 
             # Sanity: both paths must be inside Mods
             try:
-                if not os.path.commonpath([mods, older_path]).startswith(os.path.abspath(mods)):
-                    self.log(f"Skip collision outside Mods: {older_path}", "WARN"); continue
-                if not os.path.commonpath([mods, newer_path]).startswith(os.path.abspath(mods)):
-                    self.log(f"Skip collision outside Mods: {newer_path}", "WARN"); continue
+                if not commonpath([mods, older_path]).startswith(mods_abs):
+                    log(f"Skip collision outside Mods: {older_path}", "WARN"); continue
+                if not commonpath([mods, newer_path]).startswith(mods_abs):
+                    log(f"Skip collision outside Mods: {newer_path}", "WARN"); continue
             except Exception:
                 # commonpath can throw on different drives; still proceed cautiously
                 pass
 
             # If the paths are equal, do nothing
-            if os.path.abspath(older_path) == os.path.abspath(newer_path):
-                self.log(f"Skip identical paths: {os.path.basename(older_path)}", "WARN")
+            if abspath(older_path) == abspath(newer_path):
+                log(f"Skip identical paths: {basename(older_path)}", "WARN")
                 continue
 
             try:
                 # 1) Quarantine the older file
-                if os.path.exists(older_path):
-                    quarantine = _uniq_name_in(colliding_dir, os.path.basename(older_path))
-                    ensure_folder(os.path.dirname(quarantine))
-                    shutil.move(older_path, quarantine)
-                    moved_ops.append({"from": older_path, "to": quarantine})
-                    self.log(f"Quarantined older: {os.path.basename(older_path)} → {os.path.relpath(quarantine, mods)}", "OK")
+                if exists(older_path):
+                    quarantine = _uniq_name_in(colliding_dir, basename(older_path),
+                                               col_existing, col_counters)
+                    move(older_path, quarantine)
+                    record({"from": older_path, "to": quarantine})
+                    log(f"Quarantined older: {basename(older_path)} → {relpath(quarantine, mods)}", "OK")
                 else:
-                    self.log(f"Older missing, skip: {os.path.basename(older_path)}", "WARN")
+                    log(f"Older missing, skip: {basename(older_path)}", "WARN")
 
                 # 2) If destination was the older one we just moved away,
                 #    move source into the intended destination path.
-                if older_side == "dst" and os.path.exists(src):
-                    ensure_folder(os.path.dirname(dst))
+                if older_side == "dst" and exists(src):
+                    parent = dirname(dst)
+                    if parent not in ensured:
+                        ensure_folder(parent)
+                        ensured.add(parent)
                     # dst path should now be free
                     final_dst = dst
-                    if os.path.exists(final_dst):
-                        final_dst = _uniq_name_in(os.path.dirname(dst), os.path.basename(dst))
-                    shutil.move(src, final_dst)
-                    moved_ops.append({"from": src, "to": final_dst})
-                    self.log(f"Placed newer: {os.path.basename(src)} → {os.path.relpath(final_dst, mods)}", "OK")
+                    if exists(final_dst):
+                        final_dst = _uniq_name_in(parent, basename(dst))
+                    move(src, final_dst)
+                    record({"from": src, "to": final_dst})
+                    log(f"Placed newer: {basename(src)} → {relpath(final_dst, mods)}", "OK")
 
             except Exception as e:
-                self.log(f"Collision resolve error on {os.path.basename(older_path)}: {e}", "ERR")
+                log(f"Collision resolve error on {basename(older_path)}: {e}", "ERR")
 
         save_moves_log(mods, moved_ops)
         self._toggle_collision(False)
@@ -2552,52 +2927,112 @@ class Sims4ModSorterApp(Sims4ModSorterApp):  # extend with handlers
         self._refresh_tree(preserve_selection=True)
 
     def _refresh_tree(self, preserve_selection: bool = False) -> None:
-        selected = set(self.tree.selection()) if preserve_selection else set()
-        self.tree.delete(*self.tree.get_children())
-
-        by_cat: dict[str, int] = {}
-        total = len(self.items)
-
-        for idx, it in enumerate(self.items):
-            by_cat[it.guess_type] = by_cat.get(it.guess_type, 0) + 1
-
-            inc = "✓" if it.include else ""
-            rel = os.path.dirname(getattr(it, "relpath", "")) or "."
+        rev = self._items_rev
+        if preserve_selection and rev == self._tree_rev:
+            return  # rows (and selection) already show this revision
+        self._tree_rev = rev
+        # Rows are patched in place, so Tk keeps the selection on surviving rows;
+        # a plain refresh starts from no selection as a full rebuild used to.
+        if not preserve_selection:
+            sel = self.tree.selection()
+            if sel:
+                self.tree.selection_remove(sel)
+        # iid → FileItem for every row, built whole before any slice runs: actions
+        # resolve selected rows through it even while later slices are pending
+        self._iid_to_item = {_iid(i): it for i, it in enumerate(self.items)}
+        # A newer refresh makes any slices still queued for this one stale
+        self._refresh_gen += 1
+        gen = self._refresh_gen
+
+        cached = self._summary_cache
+        if cached is None or cached[0] != rev:
+            by_cat = Counter(it.guess_type for it in self.items)
+            total = len(self.items)
+
+            if total:
+                topcats = by_cat.most_common(4)
+                frag = ", ".join(f"{k}: {v}" for k, v in topcats)
+                summary = f"Planned {total} files | {frag}"
+            else:
+                summary = "No plan yet"
+            cached = self._summary_cache = (rev, summary)
+        self.summary_var.set(cached[1])
 
-            # notes can be multi-line; flatten for a single-cell view
-            flat_notes = "; ".join(
-                p.strip() for p in re.split(r"[;\n]+", str(getattr(it, "notes", "") or "")) if p.strip()
-            )
+        # First slice now so small plans appear at once; the rest on idle ticks
+        self._refresh_tick(gen, enumerate(self.items), len(self.items))
+        self._on_resize()
 
-            vals = (
-                inc,                          # Include mark
-                rel,                          # Folder (relative)
-                prettify_for_ui(it.name),     # File
-                it.ext,                       # Ext
-                it.guess_type,                # Type
-                f"{getattr(it, 'size_mb', 0.0):.2f}",  # MB
-                it.target_folder,             # Target Folder
-                flat_notes,                   # Notes
-                f"{getattr(it, 'confidence', 0.0):.2f}",  # Conf
-            )
-            iid = str(idx)
-            self.tree.insert("", "end", iid=iid, values=vals)
-            if iid in selected:
-                self.tree.selection_add(iid)
-
-        if total:
-            topcats = sorted(by_cat.items(), key=lambda kv: -kv[1])[:4]
-            frag = ", ".join(f"{k}: {v}" for k, v in topcats)
-            self.summary_var.set(f"Planned {total} files | {frag}")
-        else:
-            self.summary_var.set("No plan yet")
+    def _refresh_tick(self, gen: int, rows, total: int, chunk: int = 256) -> None:
+        """
+        Bring the next `chunk` rows up to date, then yield to the event loop.
+        self._row_vals holds the values each row shows, so only rows whose
+        values changed cross into Tcl; rows past `total` go after the last slice.
+        """
+        if gen != self._refresh_gen:
+            return
+        shown = self._row_vals
+
+        # Data columns are hidden only once this slice actually inserts a row, so Tk
+        # doesn't lay out every cell per insert; patch-only slices skip the reconfigure
+        prev_dc = None
+        # Raw Tcl calls skip Treeview.insert/item's per-row option formatting
+        tcl_call, tree_w = self.tree.tk.call, self.tree._w
+        pretty, flatten = prettify_for_ui, _flatten_notes
+        inc_lut, fmt2 = _INC_LUT, _fmt2
+        n_shown = len(shown)
+        n = 0
+        try:
+            for idx, it in rows:
+                vals = (
+                    inc_lut[it.include],          # Include mark
+                    it.rel_dir,                   # Folder (relative)
+                    pretty(it.name),              # File
+                    it.ext,                       # Ext
+                    it.guess_type,                # Type
+                    fmt2(it.size_mb),             # MB
+                    it.target_folder,             # Target Folder
+                    flatten(it.notes),            # Notes (multi-line → one cell)
+                    fmt2(it.confidence),          # Conf
+                )
+                iid = _iid(idx)
+                if idx >= n_shown:
+                    if prev_dc is None:
+                        prev_dc = self.tree["displaycolumns"]
+                        self.tree.configure(displaycolumns=())
+                    tcl_call(tree_w, "insert", "", "end", "-id", iid, "-values", vals)
+                    shown.append(vals)
+                    n_shown += 1
+                elif shown[idx] != vals:
+                    tcl_call(tree_w, "item", iid, "-values", vals)
+                    shown[idx] = vals
+                n += 1
+                if n >= chunk:
+                    break
+            else:
+                # Last slice: drop rows left over from a longer previous plan
+                if n_shown > total:
+                    self.tree.delete(*[_iid(i) for i in range(total, n_shown)])
+                    del shown[total:]
+        finally:
+            if prev_dc is not None:
+                self.tree.configure(displaycolumns=prev_dc)
 
-        self._on_resize()
+        if n >= chunk:
+            self.after_idle(self._refresh_tick, gen, rows, total, chunk)
 
     def _on_resize(self, event=None):
+        """Coalesce <Configure> bursts (every child widget fires one) into a single pass."""
         if getattr(self, "_respect_user_widths", False):
             return
-        if load_settings().get("col_widths"):
+        if self._resize_job:
+            try: self.after_cancel(self._resize_job)
+            except Exception: pass
+        self._resize_job = self.after(50, self._do_resize)
+
+    def _do_resize(self):
+        self._resize_job = None
+        # Saved widths always set _respect_user_widths, so no settings read here
+        if getattr(self, "_respect_user_widths", False):
             return
         # first-run only, gentle widening (optional)
         try:
@@ -2606,10 +3041,13 @@ class Sims4ModSorterApp(Sims4ModSorterApp):  # extend with handlers
             return
         if cur_w < 900:
             return
-        base = {"name": 360, "notes": 360}
         extra = max(0, cur_w - 1100)
-        self.tree.column("name",  width=base["name"]  + int(extra * 0.55))
-        self.tree.column("notes", width=base["notes"] + int(extra * 0.45))
+        column = self.tree.column
+        for col, base, share in _RESIZE_SHARES:
+            want = base + int(extra * share)
+            # each column() write is a Tcl call plus a relayout; skip no-op changes
+            if abs(int(column(col, "width")) - want) >= 2:
+                column(col, width=want)
 
     # ---- Settings save/load
 